@@ -486,6 +486,48 @@ class MediaControllerBase(Generic[ItemCls], metaclass=ABCMeta):
             extra_query_params=query_params,
         )
 
+    async def get_library_items_by_prov_ids(
+        self,
+        item_ids: Iterable[str],
+        provider_instance_id_or_domain: str,
+    ) -> list[ItemCls]:
+        """Get the library items for the given provider item ids, in the order of the ids.
+
+        Ids without a library item are skipped.
+        """
+        assert provider_instance_id_or_domain != "library"
+        item_ids = list(item_ids)
+        items_by_prov_id: dict[str, ItemCls] = {}
+        # keep well below the max number of sql variables
+        chunk_size = 500
+        for offset in range(0, len(item_ids), chunk_size):
+            chunk = item_ids[offset : offset + chunk_size]
+            query_params: dict[str, Any] = {
+                "media_type": self.media_type.value,
+                "prov_id": provider_instance_id_or_domain,
+            }
+            query_params.update({f"item_id_{i}": item_id for i, item_id in enumerate(chunk)})
+            item_id_params = ",".join(f":item_id_{i}" for i in range(len(chunk)))
+            subquery = (
+                "SELECT item_id FROM provider_mappings "
+                "WHERE provider_mappings.media_type = :media_type "
+                "AND (provider_mappings.provider_instance = :prov_id "
+                "OR provider_mappings.provider_domain = :prov_id) "
+                f"AND provider_mappings.provider_item_id IN ({item_id_params})"
+            )
+            for item in await self._get_library_items_by_query(
+                limit=len(chunk),
+                extra_query_parts=[f"WHERE {self.db_table}.item_id IN ({subquery})"],
+                extra_query_params=query_params,
+            ):
+                for mapping in item.provider_mappings:
+                    if provider_instance_id_or_domain in (
+                        mapping.provider_instance,
+                        mapping.provider_domain,
+                    ):
+                        items_by_prov_id[mapping.item_id] = item
+        return [items_by_prov_id[x] for x in item_ids if x in items_by_prov_id]
+
     async def iter_library_items_by_prov_id(
         self,
         provider_instance_id_or_domain: str,
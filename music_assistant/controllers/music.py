@@ -572,6 +572,19 @@ class MusicController(CoreController):
             provider_instance_id_or_domain=provider_instance_id_or_domain,
         )
 
+    async def get_library_items_by_prov_ids(
+        self,
+        media_type: MediaType,
+        item_ids: list[str],
+        provider_instance_id_or_domain: str,
+    ) -> list[MediaItemType]:
+        """Get library music items by provider item ids and media type, in the order of the ids."""
+        ctrl = self.get_controller(media_type)
+        return await ctrl.get_library_items_by_prov_ids(
+            item_ids=item_ids,
+            provider_instance_id_or_domain=provider_instance_id_or_domain,
+        )
+
     @api_command("music/favorites/add_item")
     async def add_item_to_favorites(
         self,
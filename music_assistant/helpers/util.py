@@ -11,16 +11,17 @@ import platform
 import re
 import socket
 import tempfile
+import time
 import urllib.error
 import urllib.parse
 import urllib.request
-from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Coroutine, Hashable
 from contextlib import suppress
 from functools import lru_cache
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as pkg_version
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, ParamSpec, Self, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, ParamSpec, Self, TypeVar
 from urllib.parse import urlparse
 
 import cchardet as chardet
@@ -43,6 +44,8 @@ LOGGER = logging.getLogger(__name__)
 HA_WHEELS = "https://wheels.home-assistant.io/musllinux/"
 
 T = TypeVar("T")
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
 CALLBACK_TYPE = Callable[[], None]
 
 
@@ -589,6 +592,51 @@ class TaskManager:
             self._tasks.clear()
 
 
+class TimedMemoryCache(Generic[_K, _V]):
+    """
+    Simple in-memory cache of which the items expire after a fixed time.
+
+    Meant for short-lived (and not serializable) objects that are requested in quick
+    succession, where a lookup in the (database backed) cache controller is too costly.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """Initialize the cache with the time (in seconds) to keep items."""
+        self._ttl = ttl
+        self._data: dict[_K, tuple[float, _V]] = {}
+        self._next_purge = 0.0
+
+    def get(self, key: _K, default: _V | None = None) -> _V | None:
+        """Return the (not expired) item or default."""
+        if (entry := self._data.get(key)) is None:
+            return default
+        if entry[0] > time.monotonic():
+            return entry[1]
+        del self._data[key]
+        return default
+
+    def set(self, key: _K, value: _V) -> None:
+        """Store an item."""
+        now = time.monotonic()
+        if now >= self._next_purge:
+            # drop expired items (at most once per ttl) to keep the cache small
+            self._data = {k: v for k, v in self._data.items() if v[0] > now}
+            self._next_purge = now + self._ttl
+        self._data[key] = (now + self._ttl, value)
+
+    def pop(self, key: _K) -> None:
+        """Remove an item (if present)."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all items."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        """Return the number of (possibly expired) items."""
+        return len(self._data)
+
+
 _R = TypeVar("_R")
 _P = ParamSpec("_P")
 
@@ -610,6 +658,44 @@ def lock(
     return wrapper
 
 
+async def merge_async_iterators(
+    *iterators: AsyncIterator[T], buffer_size: int = 1
+) -> AsyncGenerator[T, None]:
+    """
+    Iterate multiple async iterators concurrently and yield their items as they arrive.
+
+    Each iterator is consumed in a background task which fetches ahead until the
+    (shared) buffer of buffer_size items is full. With a single iterator, this can be
+    used to prefetch the next item(s) while the consumer processes the current one.
+    Any exception raised by one of the iterators is re-raised to the consumer.
+    """
+    queue: asyncio.Queue[tuple[T] | Exception | None] = asyncio.Queue(buffer_size)
+
+    async def _consume(iterator: AsyncIterator[T]) -> None:
+        try:
+            async for item in iterator:
+                await queue.put((item,))
+        except Exception as err:
+            await queue.put(err)
+        else:
+            await queue.put(None)
+
+    tasks = [asyncio.create_task(_consume(iterator)) for iterator in iterators]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            entry = await queue.get()
+            if entry is None:
+                remaining -= 1
+                continue
+            if isinstance(entry, Exception):
+                raise entry
+            yield entry[0]
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 class TimedAsyncGenerator:
     """
     Async iterable that times out after a given time.
@@ -36,6 +36,18 @@ if TYPE_CHECKING:
 
 # ruff: noqa: ARG001, ARG002
 
+# mapping of media type to the (provider) method to get a single item of that type,
+# any other media type is treated as a track
+GET_ITEM_METHODS: dict[MediaType, str] = {
+    MediaType.ARTIST: "get_artist",
+    MediaType.ALBUM: "get_album",
+    MediaType.PLAYLIST: "get_playlist",
+    MediaType.RADIO: "get_radio",
+    MediaType.AUDIOBOOK: "get_audiobook",
+    MediaType.PODCAST: "get_podcast",
+    MediaType.PODCAST_EPISODE: "get_podcast_episode",
+}
+
 
 class MusicProvider(Provider):
     """Base representation of a Music Provider (controller).
@@ -385,21 +397,8 @@ class MusicProvider(Provider):
 
     async def get_item(self, media_type: MediaType, prov_item_id: str) -> MediaItemType:
         """Get single MediaItem from provider."""
-        if media_type == MediaType.ARTIST:
-            return await self.get_artist(prov_item_id)
-        if media_type == MediaType.ALBUM:
-            return await self.get_album(prov_item_id)
-        if media_type == MediaType.PLAYLIST:
-            return await self.get_playlist(prov_item_id)
-        if media_type == MediaType.RADIO:
-            return await self.get_radio(prov_item_id)
-        if media_type == MediaType.AUDIOBOOK:
-            return await self.get_audiobook(prov_item_id)
-        if media_type == MediaType.PODCAST:
-            return await self.get_podcast(prov_item_id)
-        if media_type == MediaType.PODCAST_EPISODE:
-            return await self.get_podcast_episode(prov_item_id)
-        return await self.get_track(prov_item_id)
+        getter = getattr(self, GET_ITEM_METHODS.get(media_type, "get_track"))
+        return cast(MediaItemType, await getter(prov_item_id))
 
     async def browse(self, path: str) -> Sequence[MediaItemTypeOrItemMapping]:  # noqa: PLR0911, PLR0915
         """Browse this provider's items.
@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import html
-import json
+import math
 import os
 import re
+import zlib
 from collections.abc import AsyncGenerator
+from functools import lru_cache
 from os import PathLike
-from typing import Any
+from typing import Any, cast
 from urllib.parse import parse_qs, urlparse
 
 import audible
@@ -34,6 +35,15 @@ CACHE_DOMAIN = "audible"
 CACHE_CATEGORY_API = 0
 CACHE_CATEGORY_AUDIOBOOK = 1
 CACHE_CATEGORY_CHAPTERS = 2
+CACHE_CATEGORY_AUDIOBOOK_PARSED = 3
+# api paths with volatile responses that should never be cached
+NO_CACHE_PATHS = {"annotations/lastpositions"}
+
+LIBRARY_PAGE_SIZE = 50
+# max number of library pages to fetch concurrently
+LIBRARY_PAGE_CONCURRENCY = 4
+
+HTML_TAG_RE = re.compile(r"<[^>]+>")
 
 
 class AudibleHelper:
@@ -51,9 +61,34 @@ class AudibleHelper:
         self.client = client
         self.provider_domain = provider_domain
         self.provider_instance = provider_instance
+        self._library_semaphore = asyncio.Semaphore(LIBRARY_PAGE_CONCURRENCY)
+        self._pending_requests: dict[str, asyncio.Task[Any]] = {}
 
     async def get_library(self) -> AsyncGenerator[Audiobook, None]:
         """Fetch the user's library with pagination."""
+        # the first page tells us the total number of items,
+        # all other pages are fetched concurrently (bounded by the semaphore)
+        library = await self._fetch_library_page(1)
+        total_items = library.get("total_results", 0)
+        num_pages = math.ceil(total_items / LIBRARY_PAGE_SIZE)
+        tasks = [
+            asyncio.create_task(self._fetch_library_page(page))
+            for page in range(2, num_pages + 1)
+        ]
+        try:
+            async for audiobook in self._parse_library_page(library):
+                yield audiobook
+            for next_page in asyncio.as_completed(tasks):
+                async for audiobook in self._parse_library_page(await next_page):
+                    yield audiobook
+        finally:
+            for task in tasks:
+                task.cancel()
+            # retrieve the results, so a failed page does not log an unretrieved exception
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch_library_page(self, page: int) -> dict[str, Any]:
+        """Fetch a single (raw) page of the user's library."""
         response_groups = [
             "contributors",
             "media",
@@ -62,42 +97,37 @@ class AudibleHelper:
             "product_details",
             "product_extended_attrs",
         ]
-
-        page = 1
-        page_size = 50
-
-        while True:
-            library = await self._call_api(
-                "library",
-                use_cache=False,
-                response_groups=",".join(response_groups),
-                page=page,
-                num_results=page_size,
+        async with self._library_semaphore:
+            return cast(
+                dict[str, Any],
+                await self._call_api(
+                    "library",
+                    use_cache=False,
+                    response_groups=",".join(response_groups),
+                    page=page,
+                    num_results=LIBRARY_PAGE_SIZE,
+                ),
             )
 
-            items = library.get("items", [])
-            if not items:
-                break
-
-            for audiobook_data in items:
-                asin = audiobook_data.get("asin")
-                cached_book = await self.mass.cache.get(
-                    key=asin, base_key=CACHE_DOMAIN, category=CACHE_CATEGORY_AUDIOBOOK, default=None
+    async def _parse_library_page(
+        self, library: dict[str, Any]
+    ) -> AsyncGenerator[Audiobook, None]:
+        """Parse all items of a library page, preferring the cached (full) audiobook details."""
+        items = library.get("items", [])
+        # lookup all cached audiobooks of this page at once
+        cached_books = await asyncio.gather(
+            *(
+                self.mass.cache.get(
+                    key=audiobook_data.get("asin"),
+                    base_key=CACHE_DOMAIN,
+                    category=CACHE_CATEGORY_AUDIOBOOK,
+                    default=None,
                 )
-
-                if cached_book is not None:
-                    album = await self._parse_audiobook(cached_book)
-                    yield album
-                else:
-                    album = await self._parse_audiobook(audiobook_data)
-                    yield album
-
-            # Check if we've reached the end
-            total_items = library.get("total_results", 0)
-            if page * page_size >= total_items:
-                break
-
-            page += 1
+                for audiobook_data in items
+            )
+        )
+        for audiobook_data, cached_book in zip(items, cached_books, strict=True):
+            yield await self._parse_audiobook(cached_book or audiobook_data)
 
     async def get_audiobook(self, asin: str, use_cache: bool = True) -> Audiobook | None:
         """Fetch the audiobook by asin."""
@@ -123,13 +153,12 @@ class AudibleHelper:
             category=CACHE_CATEGORY_AUDIOBOOK,
             data=response.get("item"),
         )
-        return await self._parse_audiobook(response.get("item"))
+        return await self._parse_audiobook(response.get("item"), use_cache=False)
 
     async def get_stream(self, asin: str) -> StreamDetails:
         """Get stream details for a track (audiobook chapter)."""
-        chapters = await self._fetch_chapters(asin=asin)
-
-        duration = sum(chapter["length_ms"] for chapter in chapters) / 1000
+        chapters_data = await self._fetch_chapters(asin=asin)
+        duration = chapters_data["duration"]
 
         playback_info = await self.client.post(
             f"content/{asin}/licenserequest",
@@ -169,24 +198,30 @@ class AudibleHelper:
             data={"acr": acr},
         )
 
-    async def _fetch_chapters(self, asin: str) -> Any:
-        chapters_data: list[Any] = await self.mass.cache.get(
-            base_key=CACHE_DOMAIN, category=CACHE_CATEGORY_CHAPTERS, key=asin, default=[]
+    async def _fetch_chapters(self, asin: str) -> dict[str, Any]:
+        """Fetch the chapters of an audiobook, including the (precomputed) total duration."""
+        chapters_data: dict[str, Any] | list[Any] | None = await self.mass.cache.get(
+            base_key=CACHE_DOMAIN, category=CACHE_CATEGORY_CHAPTERS, key=asin, default=None
         )
+        if isinstance(chapters_data, list) and chapters_data:
+            # older cache entries only contain the list of chapters
+            chapters_data = _create_chapters_data(chapters_data)
         if not chapters_data:
             response = await self._call_api(
                 f"content/{asin}/metadata",
                 response_groups="chapter_info, always-returned, content_reference, content_url",
                 chapter_titles_type="Flat",
             )
-            chapters_data = response.get("content_metadata").get("chapter_info").get("chapters")
+            chapters_data = _create_chapters_data(
+                response.get("content_metadata").get("chapter_info").get("chapters")
+            )
             await self.mass.cache.set(
                 base_key=CACHE_DOMAIN,
                 category=CACHE_CATEGORY_CHAPTERS,
                 key=asin,
                 data=chapters_data,
             )
-        return chapters_data
+        return cast(dict[str, Any], chapters_data)
 
     async def get_last_postion(self, asin: str) -> int:
         """Fetch last position of asin."""
@@ -201,33 +236,56 @@ class AudibleHelper:
         """Report last position."""
 
     async def _call_api(self, path: str, **kwargs: Any) -> Any:
+        if path in NO_CACHE_PATHS:
+            # volatile data, no need to (cache or) build a cache key
+            return await self.client.get(path, **kwargs)
         response = None
         use_cache = False
-        params_str = json.dumps(kwargs, sort_keys=True)
-        params_hash = hashlib.md5(params_str.encode()).hexdigest()
-        cache_key_with_params = f"{path}:{params_hash}"
+        cache_key_with_params = _create_cache_key(path, kwargs)
         if use_cache:
             response = await self.mass.cache.get(
                 key=cache_key_with_params, base_key=CACHE_DOMAIN, category=CACHE_CATEGORY_API
             )
         if not response:
-            response = await self.client.get(path, **kwargs)
+            # coalesce concurrent calls for the exact same request into a single api call
+            if (request := self._pending_requests.get(cache_key_with_params)) is not None:
+                return await asyncio.shield(request)
+            request = asyncio.create_task(self.client.get(path, **kwargs))
+            self._pending_requests[cache_key_with_params] = request
+            request.add_done_callback(
+                lambda _: self._pending_requests.pop(cache_key_with_params, None)
+            )
+            response = await asyncio.shield(request)
             await self.mass.cache.set(
                 key=cache_key_with_params, base_key=CACHE_DOMAIN, data=response
             )
         return response
 
-    async def _parse_audiobook(self, audiobook_data: dict[str, Any]) -> Audiobook:
+    async def _parse_audiobook(
+        self, audiobook_data: dict[str, Any], use_cache: bool = True
+    ) -> Audiobook:
         asin = audiobook_data.get("asin", "")
+        # the parsed audiobook is only valid for the same (parsed) audible data
+        checksum = _create_audiobook_checksum(audiobook_data)
+        if use_cache:
+            # prefer the previously parsed audiobook, only the resume position is volatile
+            cached_book = await self.mass.cache.get(
+                key=asin,
+                base_key=CACHE_DOMAIN,
+                category=CACHE_CATEGORY_AUDIOBOOK_PARSED,
+                checksum=checksum,
+            )
+            if cached_book is not None:
+                book = Audiobook.from_dict(cached_book)
+                book.resume_position_ms = await self.get_last_postion(asin=asin)
+                return book
         title = audiobook_data.get("title", "")
-        authors = []
-        narrators = []
-        for narrator in audiobook_data.get("narrators", []):
-            narrators.append(narrator.get("name"))
-        for author in audiobook_data.get("authors", []):
-            authors.append(author.get("name"))
-        chapters_data = await self._fetch_chapters(asin=asin)
-        duration = sum(chapter["length_ms"] for chapter in chapters_data) / 1000
+        authors = [author.get("name") for author in audiobook_data.get("authors") or ()]
+        narrators = [narrator.get("name") for narrator in audiobook_data.get("narrators") or ()]
+        chapters_data, last_position = await asyncio.gather(
+            self._fetch_chapters(asin=asin), self.get_last_postion(asin=asin)
+        )
+        duration = chapters_data["duration"]
         book = Audiobook(
             item_id=asin,
             provider=self.provider_instance,
@@ -254,7 +312,7 @@ class AudibleHelper:
         if reviews:
             book.metadata.review = _html_to_txt(reviews[0])
         book.metadata.genres = {
-            genre.replace("_", " ") for genre in audiobook_data.get("platinum_keywords", "")
+            genre.replace("_", " ") for genre in audiobook_data.get("platinum_keywords") or ()
         }
         book.metadata.images = UniqueList(
             [
@@ -274,7 +332,7 @@ class AudibleHelper:
         )
 
         chapters = []
-        for index, chapter_data in enumerate(chapters_data):
+        for index, chapter_data in enumerate(chapters_data["chapters"]):
             start = int(chapter_data.get("start_offset_sec", 0))
             length = int(chapter_data.get("length_ms", 0)) / 1000
             chapters.append(
@@ -283,7 +341,14 @@ class AudibleHelper:
                 )
             )
         book.metadata.chapters = chapters
-        book.resume_position_ms = await self.get_last_postion(asin=asin)
+        await self.mass.cache.set(
+            key=asin,
+            base_key=CACHE_DOMAIN,
+            category=CACHE_CATEGORY_AUDIOBOOK_PARSED,
+            data=book.to_dict(),
+            checksum=checksum,
+        )
+        book.resume_position_ms = last_position
         return book
 
     async def deregister(self) -> None:
@@ -291,12 +356,52 @@ class AudibleHelper:
         await asyncio.to_thread(self.client.auth.deregister_device)
 
 
+def _create_chapters_data(chapters: list[Any]) -> dict[str, Any]:
+    """Create the (cacheable) chapters data, including the total duration in seconds."""
+    return {
+        "chapters": chapters,
+        "duration": sum(chapter["length_ms"] for chapter in chapters) / 1000,
+    }
+
+
+def _create_audiobook_checksum(audiobook_data: dict[str, Any]) -> str:
+    """Create a (cheap) checksum of the audible fields an audiobook is parsed from."""
+    parsed_fields = (
+        audiobook_data.get("title"),
+        [author.get("name") for author in audiobook_data.get("authors") or ()],
+        [narrator.get("name") for narrator in audiobook_data.get("narrators") or ()],
+        audiobook_data.get("publisher_name"),
+        audiobook_data.get("copyright"),
+        audiobook_data.get("extended_product_description"),
+        audiobook_data.get("language"),
+        audiobook_data.get("release_date"),
+        audiobook_data.get("editorial_reviews"),
+        audiobook_data.get("platinum_keywords"),
+        (audiobook_data.get("product_images") or {}).get("500"),
+    )
+    return str(zlib.crc32(repr(parsed_fields).encode()))
+
+
+def _create_cache_key(path: str, params: dict[str, Any]) -> str:
+    """Create a (deterministic) cache key for an api call."""
+    return (
+        path
+        + "?"
+        + "&".join(
+            f"{key}={value if isinstance(value, str | int | float | bool) else value!r}"
+            for key, value in sorted(params.items())
+        )
+    )
+
+
 def _html_to_txt(html_text: str) -> str:
-    txt = html.unescape(html_text)
-    tags = re.findall("<[^>]+>", txt)
-    for tag in tags:
-        txt = txt.replace(tag, "")
-    return txt
+    return HTML_TAG_RE.sub("", html.unescape(html_text))
+
+
+@lru_cache(maxsize=16)
+def _get_locale(locale: str) -> audible.localization.Locale:
+    """Return the (cached) Audible Locale object for a locale code."""
+    return audible.localization.Locale(locale)
 
 
 # Audible Authorization
@@ -313,7 +418,7 @@ async def audible_get_auth_info(locale: str) -> tuple[str, str, str]:
         - serial (str): The generated device serial number
     """
     # Create locale object (not I/O operation)
-    locale_obj = audible.localization.Locale(locale)
+    locale_obj = _get_locale(locale)
 
     # Create code verifier (potential crypto operations)
     code_verifier = await asyncio.to_thread(audible.login.create_code_verifier)
@@ -348,7 +453,7 @@ async def audible_custom_login(
         LoginFailed: If authorization code is not found in the URL
     """
     auth = audible.Authenticator()
-    auth.locale = audible.localization.Locale(locale)
+    auth.locale = _get_locale(locale)
 
     # URL parsing (not I/O operation)
     response_url_parsed = urlparse(response_url)
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator, Sequence
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable, Sequence
 from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import TYPE_CHECKING
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, TypeVar
 
 import aioaudiobookshelf as aioabs
 from aioaudiobookshelf.client.items import LibraryItemExpandedBook as AbsLibraryItemExpandedBook
@@ -33,10 +35,16 @@ from music_assistant_models.enums import (
     StreamType,
 )
 from music_assistant_models.errors import LoginFailed, MediaNotFoundError
-from music_assistant_models.media_items import AudioFormat, BrowseFolder, MediaItemTypeOrItemMapping
+from music_assistant_models.media_items import (
+    AudioFormat,
+    BrowseFolder,
+    MediaItemType,
+    MediaItemTypeOrItemMapping,
+)
 from music_assistant_models.streamdetails import StreamDetails
 
 from music_assistant.helpers.ffmpeg import get_ffmpeg_stream
+from music_assistant.helpers.util import TimedMemoryCache, merge_async_iterators
 from music_assistant.models.music_provider import MusicProvider
 from music_assistant.providers.audiobookshelf.parsers import (
     parse_audiobook,
@@ -46,13 +54,19 @@ from music_assistant.providers.audiobookshelf.parsers import (
 
 if TYPE_CHECKING:
     from aioaudiobookshelf.schema.events_socket import LibraryItemRemoved
+    from aioaudiobookshelf.schema.library import Library as AbsLibrary
     from aioaudiobookshelf.schema.media_progress import MediaProgress
+    from aioaudiobookshelf.schema.podcast import (
+        PodcastEpisodeExpanded as AbsPodcastEpisodeExpanded,
+    )
     from music_assistant_models.media_items import Audiobook, Podcast, PodcastEpisode
     from music_assistant_models.provider import ProviderManifest
 
     from music_assistant.mass import MusicAssistant
     from music_assistant.models import ProviderInstanceType
 
+_T = TypeVar("_T")
+
 CONF_URL = "url"
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
@@ -67,6 +81,83 @@ CONF_HIDE_EMPTY_PODCASTS = "hide_empty_podcasts"
 # of a library.
 CACHE_CATEGORY_LIBRARIES = 0
 CACHE_KEY_LIBRARIES = "libraries"
+CACHE_KEY_MEDIA_PROGRESS = "media_progress"
+
+# number of library pages to fetch ahead (across all libraries) during library sync
+LIBRARY_PAGES_PREFETCH = 2
+# number of expanded item batches to request concurrently per library during library sync,
+# keep this (times the number of libraries) well below the per host connection limit
+# of the shared http session
+LIBRARY_BATCH_CONCURRENCY = 4
+# max number of item ids per expanded batch request (a library page is split up if needed)
+LIBRARY_BATCH_SIZE = 10
+# number of parsed library items to buffer ahead of the consumer during library sync
+LIBRARY_ITEMS_BUFFER = 64
+# time (in seconds) to keep an expanded podcast (with its episodes) in memory
+PODCAST_CACHE_TTL = 60
+# time (in seconds) to keep an expanded audiobook in memory
+AUDIOBOOK_CACHE_TTL = 60
+# delay (in seconds) to collect socket changes of the libraries before storing them
+LIBRARIES_CACHE_WRITE_DELAY = 5
+# time (in seconds) to reuse the list of libraries of the server
+ALL_LIBRARIES_CACHE_TTL = 60
+# time (in seconds) to keep the media progresses of the user in memory
+MEDIA_PROGRESS_CACHE_TTL = 30
+# time (in seconds) to cache the authors, narrators, series and collections of a library
+# and the book ids of an author, series or collection
+BROWSE_CACHE_TTL = 300
+# time (in seconds) to keep the library items looked up for browsing in memory
+LIBRARY_ITEM_CACHE_TTL = 30
+
+SUPPORTED_FEATURES = {
+    ProviderFeature.LIBRARY_PODCASTS,
+    ProviderFeature.LIBRARY_AUDIOBOOKS,
+    ProviderFeature.BROWSE,
+}
+
+
+# the config entries do not depend on the instance, so they are only built once
+CONFIG_ENTRIES = (
+    ConfigEntry(
+        key=CONF_URL,
+        type=ConfigEntryType.STRING,
+        label="Server",
+        required=True,
+        description="The url of the Audiobookshelf server to connect to.",
+    ),
+    ConfigEntry(
+        key=CONF_USERNAME,
+        type=ConfigEntryType.STRING,
+        label="Username",
+        required=True,
+        description="The username to authenticate to the remote server.",
+    ),
+    ConfigEntry(
+        key=CONF_PASSWORD,
+        type=ConfigEntryType.SECURE_STRING,
+        label="Password",
+        required=False,
+        description="The password to authenticate to the remote server.",
+    ),
+    ConfigEntry(
+        key=CONF_VERIFY_SSL,
+        type=ConfigEntryType.BOOLEAN,
+        label="Verify SSL",
+        required=False,
+        description="Whether or not to verify the certificate of SSL/TLS connections.",
+        category="advanced",
+        default_value=True,
+    ),
+    ConfigEntry(
+        key=CONF_HIDE_EMPTY_PODCASTS,
+        type=ConfigEntryType.BOOLEAN,
+        label="Hide empty podcasts.",
+        required=False,
+        description="This will skip podcasts with no episodes associated.",
+        category="advanced",
+        default_value=False,
+    ),
+)
 
 
 class AbsBrowsePaths(StrEnum):
@@ -124,6 +215,33 @@ ABSBROWSEITEMSTOPATH: dict[str, str] = {
     AbsBrowseItemsBook.AUDIOBOOKS: AbsBrowsePaths.AUDIOBOOKS,
 }
 
+# (name, path, item_id) of the sub folders of an audiobook library in the browse view
+LIB_AUDIOBOOKS_FOLDERS: tuple[tuple[str, str, str], ...] = tuple(
+    (item_name, ABSBROWSEITEMSTOPATH[item_name], item_name.lower())
+    for item_name in AbsBrowseItemsBook
+)
+# sub folders of an audiobook library of which the listing is prefetched when the library
+# is opened, only those which need a single request (series and collections are paged)
+LIB_PREFETCH_PATHS = (AbsBrowsePaths.AUTHORS, AbsBrowsePaths.NARRATORS)
+
+
+@lru_cache(maxsize=64)
+def get_lib_audiobooks_folders(provider: str, current_path: str) -> tuple[BrowseFolder, ...]:
+    """Return the (static) sub folders of an audiobook library in the browse view."""
+    return tuple(
+        BrowseFolder(item_id=item_id, name=name, provider=provider, path=f"{current_path}/{path}")
+        for name, path, item_id in LIB_AUDIOBOOKS_FOLDERS
+    )
+
+
+@lru_cache(maxsize=256)
+def split_episode_id(prov_episode_id: str) -> tuple[str, str]:
+    """Split the id of an episode, f"{podcast_id} {episode_id}", into its two parts."""
+    prov_podcast_id, sep, episode_id = prov_episode_id.partition(" ")
+    if not sep:
+        raise MediaNotFoundError(f"Invalid episode id {prov_episode_id}")
+    return prov_podcast_id, episode_id
+
 
 async def setup(
     mass: MusicAssistant, manifest: ProviderManifest, config: ProviderConfig
@@ -146,47 +264,7 @@ async def get_config_entries(
     values: the (intermediate) raw values for config entries sent with the action.
     """
     # ruff: noqa: ARG001
-    return (
-        ConfigEntry(
-            key=CONF_URL,
-            type=ConfigEntryType.STRING,
-            label="Server",
-            required=True,
-            description="The url of the Audiobookshelf server to connect to.",
-        ),
-        ConfigEntry(
-            key=CONF_USERNAME,
-            type=ConfigEntryType.STRING,
-            label="Username",
-            required=True,
-            description="The username to authenticate to the remote server.",
-        ),
-        ConfigEntry(
-            key=CONF_PASSWORD,
-            type=ConfigEntryType.SECURE_STRING,
-            label="Password",
-            required=False,
-            description="The password to authenticate to the remote server.",
-        ),
-        ConfigEntry(
-            key=CONF_VERIFY_SSL,
-            type=ConfigEntryType.BOOLEAN,
-            label="Verify SSL",
-            required=False,
-            description="Whether or not to verify the certificate of SSL/TLS connections.",
-            category="advanced",
-            default_value=True,
-        ),
-        ConfigEntry(
-            key=CONF_HIDE_EMPTY_PODCASTS,
-            type=ConfigEntryType.BOOLEAN,
-            label="Hide empty podcasts.",
-            required=False,
-            description="This will skip podcasts with no episodes associated.",
-            category="advanced",
-            default_value=False,
-        ),
-    )
+    return CONFIG_ENTRIES
 
 
 class Audiobookshelf(MusicProvider):
@@ -195,11 +273,7 @@ class Audiobookshelf(MusicProvider):
     @property
     def supported_features(self) -> set[ProviderFeature]:
         """Features supported by this Provider."""
-        return {
-            ProviderFeature.LIBRARY_PODCASTS,
-            ProviderFeature.LIBRARY_AUDIOBOOKS,
-            ProviderFeature.BROWSE,
-        }
+        return SUPPORTED_FEATURES
 
     async def handle_async_init(self) -> None:
         """Pass config values to client and initialize."""
@@ -207,6 +281,61 @@ class Audiobookshelf(MusicProvider):
         username = str(self.config.get_value(CONF_USERNAME))
         password = str(self.config.get_value(CONF_PASSWORD))
         verify_ssl = bool(self.config.get_value(CONF_VERIFY_SSL))
+        # these are used for (almost) every parsed item, so only look them up once
+        self._base_url = base_url.rstrip("/")
+        self._hide_empty_podcasts = bool(self.config.get_value(CONF_HIDE_EMPTY_PODCASTS))
+        # podcast_id: (expanded podcast, episodes by id)
+        self._podcast_cache: TimedMemoryCache[
+            str,
+            tuple[AbsLibraryItemExpandedPodcast, dict[str, tuple[int, AbsPodcastEpisodeExpanded]]],
+        ] = TimedMemoryCache(PODCAST_CACHE_TTL)
+        # audiobook_id: expanded audiobook
+        self._audiobook_cache: TimedMemoryCache[str, AbsLibraryItemExpandedBook] = (
+            TimedMemoryCache(AUDIOBOOK_CACHE_TTL)
+        )
+        # media progress of the user by (library item id, episode id)
+        self._media_progress_cache: TimedMemoryCache[
+            str, dict[tuple[str, str | None], MediaProgress]
+        ] = TimedMemoryCache(MEDIA_PROGRESS_CACHE_TTL)
+        # (media type, provider item id): library item
+        self._library_item_cache: TimedMemoryCache[tuple[MediaType, str], MediaItemType] = (
+            TimedMemoryCache(LIBRARY_ITEM_CACHE_TTL)
+        )
+        # (media type, provider item ids): in-flight library lookup, shared by concurrent callers
+        self._lookup_requests: dict[
+            tuple[MediaType, tuple[str, ...]], asyncio.Task[list[MediaItemType]]
+        ] = {}
+        # all libraries of the server
+        self._all_libraries: TimedMemoryCache[str, list[AbsLibrary]] = TimedMemoryCache(
+            ALL_LIBRARIES_CACHE_TTL
+        )
+        # pending (debounced) write of the libraries to the cache
+        self._libraries_cache_write: asyncio.TimerHandle | None = None
+        # (library id, path key): authors, narrators, series or collections of a library
+        self._browse_cache: TimedMemoryCache[
+            tuple[str, str], Sequence[MediaItemTypeOrItemMapping]
+        ] = TimedMemoryCache(BROWSE_CACHE_TTL)
+        # (path key, author/ series/ collection id): (series (id, name), book ids)
+        self._book_ids_cache: TimedMemoryCache[
+            tuple[str, str], tuple[list[tuple[str, str]], list[str]]
+        ] = TimedMemoryCache(BROWSE_CACHE_TTL)
+        # (library id, path key): in-flight fetch of a library listing, shared by concurrent callers
+        self._browse_requests: dict[
+            tuple[str, str], asyncio.Task[Sequence[MediaItemTypeOrItemMapping]]
+        ] = {}
+        # root browse folders, these only depend on the ids and names of the libraries,
+        # which only change on a library sync (socket events only change the item ids)
+        self._root_folders: list[BrowseFolder] | None = None
+        # podcast_id: in-flight fetch of the expanded podcast, shared by concurrent callers
+        self._podcast_requests: dict[
+            str,
+            asyncio.Task[
+                tuple[
+                    AbsLibraryItemExpandedPodcast,
+                    dict[str, tuple[int, AbsPodcastEpisodeExpanded]],
+                ]
+            ],
+        ] = {}
         session_config = aioabs.SessionConfiguration(
             session=self.mass.http_session,
             url=base_url,
@@ -251,6 +380,9 @@ class Audiobookshelf(MusicProvider):
         Called when provider is deregistered (e.g. MA exiting or config reloading).
         is_removed will be set to True when the provider is removed from the configuration.
         """
+        if self._libraries_cache_write is not None:
+            # store pending changes of the libraries right away
+            await self._cache_set_helper_libraries()
         await self._client.logout()
         await self._client_socket.logout()
 
@@ -262,7 +394,10 @@ class Audiobookshelf(MusicProvider):
 
     async def sync_library(self, media_type: MediaType) -> None:
         """Obtain audiobook library ids and podcast library ids."""
-        libraries = await self._client.get_all_libraries()
+        # a sync runs for each media type in quick succession, so reuse the libraries
+        if (libraries := self._all_libraries.get(CACHE_KEY_LIBRARIES)) is None:
+            libraries = await self._client.get_all_libraries()
+            self._all_libraries.set(CACHE_KEY_LIBRARIES, libraries)
         for library in libraries:
             if library.media_type == AbsLibraryMediaType.BOOK and media_type == MediaType.AUDIOBOOK:
                 self.libraries.audiobooks[library.id_] = LibraryHelper(name=library.name)
@@ -271,6 +406,14 @@ class Audiobookshelf(MusicProvider):
                 and media_type == MediaType.PODCAST
             ):
                 self.libraries.podcasts[library.id_] = LibraryHelper(name=library.name)
+        self._root_folders = None
+        # the library sync fetches everything fresh anyway
+        self._library_item_cache.clear()
+        self._book_ids_cache.clear()
+        if media_type == MediaType.AUDIOBOOK:
+            self._audiobook_cache.clear()
+        elif media_type == MediaType.PODCAST:
+            self._podcast_cache.clear()
         await super().sync_library(media_type=media_type)
         await self._cache_set_helper_libraries()
 
@@ -280,41 +423,128 @@ class Audiobookshelf(MusicProvider):
         Minified podcast information is enough, but we take the full information
         and rely on cache afterwards.
         """
-        for pod_lib_id in self.libraries.podcasts:
-            async for response in self._client.get_library_items(library_id=pod_lib_id):
+        # fetch and parse ahead while the podcasts are being processed by the caller
+        async for mass_podcast in merge_async_iterators(
+            self._iter_library_podcasts(), buffer_size=LIBRARY_ITEMS_BUFFER
+        ):
+            yield mass_podcast
+
+    async def _iter_library_podcasts(self) -> AsyncGenerator[Podcast, None]:
+        async for pod_lib_id, podcast_ids, podcasts_expanded in merge_async_iterators(
+            *(
+                self._iter_library_batches(lib_id, self._client.get_library_item_batch_podcast)
+                for lib_id in self.libraries.podcasts
+            ),
+            buffer_size=LIBRARY_PAGES_PREFETCH,
+        ):
+            # store uuids
+            self.libraries.podcasts[pod_lib_id].item_ids.update(podcast_ids)
+            # bind the shared parse arguments once per page
+            lookup_key = self.lookup_key
+            domain = self.domain
+            instance_id = self.instance_id
+            token = self._client.token
+            base_url = self._base_url
+            hide_empty = self._hide_empty_podcasts
+            for podcast_expanded in podcasts_expanded:
+                # skip empty podcasts before spending any effort on parsing them
+                if hide_empty and not podcast_expanded.media.episodes:
+                    continue
+                yield parse_podcast(
+                    abs_podcast=podcast_expanded,
+                    lookup_key=lookup_key,
+                    domain=domain,
+                    instance_id=instance_id,
+                    token=token,
+                    base_url=base_url,
+                )
+
+    async def _iter_library_batches(
+        self,
+        library_id: str,
+        get_batch: Callable[..., Awaitable[Sequence[_T]]],
+    ) -> AsyncGenerator[tuple[str, list[str], Sequence[_T]], None]:
+        """Iterate the pages of a library, yielding library id, item ids and expanded items.
+
+        The expanded items of several pages are requested concurrently and
+        are yielded as soon as they arrive, the order is irrelevant for the sync.
+        """
+        pending: dict[asyncio.Task[Sequence[_T]], list[str]] = {}
+        try:
+            # fetch the next page of ids while the batches of the current one are requested
+            async for response in merge_async_iterators(
+                self._client.get_library_items(library_id=library_id)
+            ):
                 if not response.results:
                     break
-                podcast_ids = [x.id_ for x in response.results]
-                # store uuids
-                self.libraries.podcasts[pod_lib_id].item_ids.update(podcast_ids)
-                podcasts_expanded = await self._client.get_library_item_batch_podcast(
-                    item_ids=podcast_ids
-                )
-                for podcast_expanded in podcasts_expanded:
-                    mass_podcast = parse_podcast(
-                        abs_podcast=podcast_expanded,
-                        lookup_key=self.lookup_key,
-                        domain=self.domain,
-                        instance_id=self.instance_id,
-                        token=self._client.token,
-                        base_url=str(self.config.get_value(CONF_URL)).rstrip("/"),
-                    )
-                    if (
-                        bool(self.config.get_value(CONF_HIDE_EMPTY_PODCASTS))
-                        and mass_podcast.total_episodes == 0
-                    ):
-                        continue
-                    yield mass_podcast
+                item_ids = [x.id_ for x in response.results]
+                task = asyncio.create_task(self._get_library_items_batch(get_batch, item_ids))
+                pending[task] = item_ids
+                if len(pending) < LIBRARY_BATCH_CONCURRENCY:
+                    continue
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield library_id, pending.pop(task), task.result()
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield library_id, pending.pop(task), task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _get_library_items_batch(
+        self,
+        get_batch: Callable[..., Awaitable[Sequence[_T]]],
+        item_ids: list[str],
+    ) -> list[_T]:
+        """Return the expanded items of a library page using the given batch call of the client."""
+        # smaller batches are served quicker by abs, so split the page and request concurrently
+        batches = await asyncio.gather(
+            *(
+                get_batch(item_ids=item_ids[i : i + LIBRARY_BATCH_SIZE])
+                for i in range(0, len(item_ids), LIBRARY_BATCH_SIZE)
+            )
+        )
+        return [item for batch in batches for item in batch]
 
     async def _get_abs_expanded_podcast(
         self, prov_podcast_id: str
     ) -> AbsLibraryItemExpandedPodcast:
+        abs_podcast, _ = await self._get_abs_expanded_podcast_with_episodes(prov_podcast_id)
+        return abs_podcast
+
+    async def _get_abs_expanded_podcast_with_episodes(
+        self, prov_podcast_id: str
+    ) -> tuple[AbsLibraryItemExpandedPodcast, dict[str, tuple[int, AbsPodcastEpisodeExpanded]]]:
+        """Return expanded podcast and its episodes by id (with their 1-based position).
+
+        The result is kept for a short time, as the episodes of the same podcast
+        are usually requested in quick succession (e.g. episode, streamdetails, progress).
+        """
+        if (cached := self._podcast_cache.get(prov_podcast_id)) is not None:
+            return cached
+        # coalesce concurrent requests for the same podcast into a single fetch
+        if (task := self._podcast_requests.get(prov_podcast_id)) is None:
+            task = self.mass.create_task(self._fetch_abs_expanded_podcast(prov_podcast_id))
+            self._podcast_requests[prov_podcast_id] = task
+            task.add_done_callback(lambda _: self._podcast_requests.pop(prov_podcast_id, None))
+        # shield, so a cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _fetch_abs_expanded_podcast(
+        self, prov_podcast_id: str
+    ) -> tuple[AbsLibraryItemExpandedPodcast, dict[str, tuple[int, AbsPodcastEpisodeExpanded]]]:
         abs_podcast = await self._client.get_library_item_podcast(
             podcast_id=prov_podcast_id, expanded=True
         )
         assert isinstance(abs_podcast, AbsLibraryItemExpandedPodcast)
-
-        return abs_podcast
+        episodes = {
+            abs_episode.id_: (episode_cnt, abs_episode)
+            for episode_cnt, abs_episode in enumerate(abs_podcast.media.episodes, 1)
+        }
+        self._podcast_cache.set(prov_podcast_id, (abs_podcast, episodes))
+        return abs_podcast, episodes
 
     async def get_podcast(self, prov_podcast_id: str) -> Podcast:
         """Get single podcast.
@@ -332,7 +562,7 @@ class Audiobookshelf(MusicProvider):
             domain=self.domain,
             instance_id=self.instance_id,
             token=self._client.token,
-            base_url=str(self.config.get_value(CONF_URL)).rstrip("/"),
+            base_url=self._base_url,
         )
 
     async def get_podcast_episodes(self, prov_podcast_id: str) -> list[PodcastEpisode]:
@@ -340,92 +570,119 @@ class Audiobookshelf(MusicProvider):
 
         Adds progress information.
         """
-        abs_podcast = await self._get_abs_expanded_podcast(prov_podcast_id=prov_podcast_id)
-        episode_list = []
-        episode_cnt = 1
         # the user has the progress of all media items
         # so we use a single api call here to obtain possibly many
-        # progresses for episodes
-        user = await self._client.get_my_user()
-        abs_progresses = {
-            x.episode_id: x
-            for x in user.media_progress
-            if x.episode_id is not None and x.library_item_id == prov_podcast_id
-        }
-        for abs_episode in abs_podcast.media.episodes:
-            progress = abs_progresses.get(abs_episode.id_, None)
-            mass_episode = parse_podcast_episode(
+        # progresses for episodes, which we run alongside the podcast request
+        abs_podcast, abs_progresses = await asyncio.gather(
+            self._get_abs_expanded_podcast(prov_podcast_id=prov_podcast_id),
+            self._get_media_progresses(),
+        )
+        lookup_key = self.lookup_key
+        domain = self.domain
+        instance_id = self.instance_id
+        token = self._client.token
+        base_url = self._base_url
+        return [
+            parse_podcast_episode(
                 episode=abs_episode,
                 prov_podcast_id=prov_podcast_id,
                 fallback_episode_cnt=episode_cnt,
-                lookup_key=self.lookup_key,
-                domain=self.domain,
-                instance_id=self.instance_id,
-                token=self._client.token,
-                base_url=str(self.config.get_value(CONF_URL)).rstrip("/"),
-                media_progress=progress,
+                lookup_key=lookup_key,
+                domain=domain,
+                instance_id=instance_id,
+                token=token,
+                base_url=base_url,
+                media_progress=abs_progresses.get((prov_podcast_id, abs_episode.id_)),
             )
-            episode_list.append(mass_episode)
-            episode_cnt += 1
-        return episode_list
+            for episode_cnt, abs_episode in enumerate(abs_podcast.media.episodes, 1)
+        ]
+
+    async def _get_media_progresses(self) -> dict[tuple[str, str | None], MediaProgress]:
+        """Return the media progresses of the user by (library item id, episode id).
+
+        The user holds the progress of all media items, so a single api call
+        serves the progress of many items. The result is kept for a short time.
+        """
+        if (progresses := self._media_progress_cache.get(CACHE_KEY_MEDIA_PROGRESS)) is not None:
+            return progresses
+        user = await self._client.get_my_user()
+        progresses = {(x.library_item_id, x.episode_id): x for x in user.media_progress}
+        self._media_progress_cache.set(CACHE_KEY_MEDIA_PROGRESS, progresses)
+        return progresses
 
     async def get_podcast_episode(self, prov_episode_id: str) -> PodcastEpisode:
         """Get single podcast episode."""
-        prov_podcast_id, e_id = prov_episode_id.split(" ")
-        abs_podcast = await self._get_abs_expanded_podcast(prov_podcast_id=prov_podcast_id)
-        episode_cnt = 1
-        for abs_episode in abs_podcast.media.episodes:
-            if abs_episode.id_ == e_id:
-                progress = await self._client.get_my_media_progress(
-                    item_id=prov_podcast_id, episode_id=abs_episode.id_
-                )
-                return parse_podcast_episode(
-                    episode=abs_episode,
-                    prov_podcast_id=prov_podcast_id,
-                    fallback_episode_cnt=episode_cnt,
-                    lookup_key=self.lookup_key,
-                    domain=self.domain,
-                    instance_id=self.instance_id,
-                    token=self._client.token,
-                    base_url=str(self.config.get_value(CONF_URL)).rstrip("/"),
-                    media_progress=progress,
-                )
-
-            episode_cnt += 1
-        raise MediaNotFoundError("Episode not found")
+        prov_podcast_id, e_id = split_episode_id(prov_episode_id)
+        _, episodes = await self._get_abs_expanded_podcast_with_episodes(prov_podcast_id)
+        if (episode := episodes.get(e_id)) is None:
+            raise MediaNotFoundError("Episode not found")
+        episode_cnt, abs_episode = episode
+        progress = (await self._get_media_progresses()).get((prov_podcast_id, abs_episode.id_))
+        return parse_podcast_episode(
+            episode=abs_episode,
+            prov_podcast_id=prov_podcast_id,
+            fallback_episode_cnt=episode_cnt,
+            lookup_key=self.lookup_key,
+            domain=self.domain,
+            instance_id=self.instance_id,
+            token=self._client.token,
+            base_url=self._base_url,
+            media_progress=progress,
+        )
 
     async def get_library_audiobooks(self) -> AsyncGenerator[Audiobook, None]:
         """Get Audiobook libraries.
 
         Need expanded version for chapters.
         """
-        for book_lib_id in self.libraries.audiobooks:
-            async for response in self._client.get_library_items(library_id=book_lib_id):
-                if not response.results:
-                    break
-                book_ids = [x.id_ for x in response.results]
-                # store uuids
-                self.libraries.audiobooks[book_lib_id].item_ids.update(book_ids)
-                # use expanded version for chapters/ caching.
-                books_expanded = await self._client.get_library_item_batch_book(item_ids=book_ids)
-                for book_expanded in books_expanded:
-                    mass_audiobook = parse_audiobook(
-                        abs_audiobook=book_expanded,
-                        lookup_key=self.lookup_key,
-                        domain=self.domain,
-                        instance_id=self.instance_id,
-                        token=self._client.token,
-                        base_url=str(self.config.get_value(CONF_URL)).rstrip("/"),
-                    )
-                    yield mass_audiobook
+        # fetch and parse ahead while the audiobooks are being processed by the caller
+        async for mass_audiobook in merge_async_iterators(
+            self._iter_library_audiobooks(), buffer_size=LIBRARY_ITEMS_BUFFER
+        ):
+            yield mass_audiobook
+
+    async def _iter_library_audiobooks(self) -> AsyncGenerator[Audiobook, None]:
+        # use expanded version for chapters/ caching.
+        async for book_lib_id, book_ids, books_expanded in merge_async_iterators(
+            *(
+                self._iter_library_batches(lib_id, self._client.get_library_item_batch_book)
+                for lib_id in self.libraries.audiobooks
+            ),
+            buffer_size=LIBRARY_PAGES_PREFETCH,
+        ):
+            # store uuids
+            self.libraries.audiobooks[book_lib_id].item_ids.update(book_ids)
+            # bind the shared parse arguments once per page
+            lookup_key = self.lookup_key
+            domain = self.domain
+            instance_id = self.instance_id
+            token = self._client.token
+            base_url = self._base_url
+            for book_expanded in books_expanded:
+                yield parse_audiobook(
+                    abs_audiobook=book_expanded,
+                    lookup_key=lookup_key,
+                    domain=domain,
+                    instance_id=instance_id,
+                    token=token,
+                    base_url=base_url,
+                )
 
     async def _get_abs_expanded_audiobook(
         self, prov_audiobook_id: str
     ) -> AbsLibraryItemExpandedBook:
+        """Return expanded audiobook.
+
+        The result is kept for a short time, as the same audiobook is usually
+        requested in quick succession (e.g. details, streamdetails, progress).
+        """
+        if (abs_audiobook := self._audiobook_cache.get(prov_audiobook_id)) is not None:
+            return abs_audiobook
         abs_audiobook = await self._client.get_library_item_book(
             book_id=prov_audiobook_id, expanded=True
         )
         assert isinstance(abs_audiobook, AbsLibraryItemExpandedBook)
+        self._audiobook_cache.set(prov_audiobook_id, abs_audiobook)
 
         return abs_audiobook
 
@@ -434,7 +691,7 @@ class Audiobookshelf(MusicProvider):
 
         Progress is added here.
         """
-        progress = await self._client.get_my_media_progress(item_id=prov_audiobook_id)
+        progress = (await self._get_media_progresses()).get((prov_audiobook_id, None))
         abs_audiobook = await self._get_abs_expanded_audiobook(prov_audiobook_id=prov_audiobook_id)
         return parse_audiobook(
             abs_audiobook=abs_audiobook,
@@ -442,7 +699,7 @@ class Audiobookshelf(MusicProvider):
             domain=self.domain,
             instance_id=self.instance_id,
             token=self._client.token,
-            base_url=str(self.config.get_value(CONF_URL)).rstrip("/"),
+            base_url=self._base_url,
             media_progress=progress,
         )
 
@@ -455,21 +712,22 @@ class Audiobookshelf(MusicProvider):
             return await self._get_stream_details_audiobook(abs_audiobook)
         raise MediaNotFoundError("Stream unknown")
 
+    def _get_stream_url(self, media_url: str) -> str:
+        """Return the (authorized) url to stream a media file of the abs server."""
+        return f"{self._base_url}{media_url}?token={self._client.token}"
+
     async def _get_stream_details_audiobook(
         self, abs_audiobook: AbsLibraryItemExpandedBook
     ) -> StreamDetails:
         """Streamdetails audiobook."""
         tracks = abs_audiobook.media.tracks
-        token = self._client.token
-        base_url = str(self.config.get_value(CONF_URL))
         if len(tracks) == 0:
             raise MediaNotFoundError("Stream not found")
         if len(tracks) > 1:
             self.logger.debug("Using playback for multiple file audiobook.")
             multiple_files = []
             for track in tracks:
-                media_url = track.content_url
-                stream_url = f"{base_url}{media_url}?token={token}"
+                stream_url = self._get_stream_url(track.content_url)
                 content_type = ContentType.UNKNOWN
                 if track.metadata is not None:
                     content_type = ContentType.try_parse(track.metadata.ext)
@@ -496,12 +754,11 @@ class Audiobookshelf(MusicProvider):
             )
 
         self.logger.debug(
-            f'Using direct playback for audiobook "{abs_audiobook.media.metadata.title}".'
+            'Using direct playback for audiobook "%s".', abs_audiobook.media.metadata.title
         )
 
         track = abs_audiobook.media.tracks[0]
-        media_url = track.content_url
-        stream_url = f"{base_url}{media_url}?token={token}"
+        stream_url = self._get_stream_url(track.content_url)
         content_type = ContentType.UNKNOWN
         if track.metadata is not None:
             content_type = ContentType.try_parse(track.metadata.ext)
@@ -520,20 +777,13 @@ class Audiobookshelf(MusicProvider):
 
     async def _get_stream_details_episode(self, podcast_id: str) -> StreamDetails:
         """Streamdetails of a podcast episode."""
-        abs_podcast_id, abs_episode_id = podcast_id.split(" ")
-        abs_episode = None
-
-        abs_podcast = await self._get_abs_expanded_podcast(prov_podcast_id=abs_podcast_id)
-        for abs_episode in abs_podcast.media.episodes:
-            if abs_episode.id_ == abs_episode_id:
-                break
-        if abs_episode is None:
+        abs_podcast_id, abs_episode_id = split_episode_id(podcast_id)
+        _, episodes = await self._get_abs_expanded_podcast_with_episodes(abs_podcast_id)
+        if (episode := episodes.get(abs_episode_id)) is None:
             raise MediaNotFoundError("Stream not found")
-        self.logger.debug(f'Using direct playback for podcast episode "{abs_episode.title}".')
-        token = self._client.token
-        base_url = str(self.config.get_value(CONF_URL))
-        media_url = abs_episode.audio_track.content_url
-        full_url = f"{base_url}{media_url}?token={token}"
+        abs_episode = episode[1]
+        self.logger.debug('Using direct playback for podcast episode "%s".', abs_episode.title)
+        full_url = self._get_stream_url(abs_episode.audio_track.content_url)
         content_type = ContentType.UNKNOWN
         if abs_episode.audio_track.metadata is not None:
             content_type = ContentType.try_parse(abs_episode.audio_track.metadata.ext)
@@ -567,7 +817,7 @@ class Audiobookshelf(MusicProvider):
             seek_position_netto = round(
                 max(0, seek_position - (total_duration - chapter_duration)), 2
             )
-            self.logger.debug(chapter_file)
+            self.logger.debug("Streaming chapter file %s", chapter_file)
             async for chunk in get_ffmpeg_stream(
                 chapter_file,
                 input_format=audio_format,
@@ -582,7 +832,7 @@ class Audiobookshelf(MusicProvider):
         """Return finished:bool, position_ms: int."""
         progress: None | MediaProgress = None
         if media_type == MediaType.PODCAST_EPISODE:
-            abs_podcast_id, abs_episode_id = item_id.split(" ")
+            abs_podcast_id, abs_episode_id = split_episode_id(item_id)
             progress = await self._client.get_my_media_progress(
                 item_id=abs_podcast_id, episode_id=abs_episode_id
             )
@@ -609,11 +859,15 @@ class Audiobookshelf(MusicProvider):
 
         """
         if media_type == MediaType.PODCAST_EPISODE:
-            abs_podcast_id, abs_episode_id = item_id.split(" ")
-            mass_podcast_episode = await self.get_podcast_episode(item_id)
-            duration = mass_podcast_episode.duration
+            abs_podcast_id, abs_episode_id = split_episode_id(item_id)
+            # we only need the duration here, so no need to fetch the progress or to parse
+            _, episodes = await self._get_abs_expanded_podcast_with_episodes(abs_podcast_id)
+            if (episode := episodes.get(abs_episode_id)) is None:
+                raise MediaNotFoundError("Episode not found")
+            abs_episode = episode[1]
+            duration = int(abs_episode.duration)
             self.logger.debug(
-                f"Updating media progress of {media_type.value}, title {mass_podcast_episode.name}."
+                "Updating media progress of %s, title %s.", media_type.value, abs_episode.title
             )
             await self._client.update_my_media_progress(
                 item_id=abs_podcast_id,
@@ -622,16 +876,23 @@ class Audiobookshelf(MusicProvider):
                 progress_seconds=position,
                 is_finished=fully_played,
             )
+            self._media_progress_cache.clear()
         if media_type == MediaType.AUDIOBOOK:
-            mass_audiobook = await self.get_audiobook(item_id)
-            duration = mass_audiobook.duration
-            self.logger.debug(f"Updating {media_type.value} named {mass_audiobook.name} progress")
+            # we only need the duration here, so no need to fetch the progress or to parse
+            abs_audiobook = await self._get_abs_expanded_audiobook(prov_audiobook_id=item_id)
+            duration = int(abs_audiobook.media.duration)
+            self.logger.debug(
+                "Updating %s named %s progress",
+                media_type.value,
+                abs_audiobook.media.metadata.title,
+            )
             await self._client.update_my_media_progress(
                 item_id=item_id,
                 duration_seconds=duration,
                 progress_seconds=position,
                 is_finished=fully_played,
             )
+            self._media_progress_cache.clear()
 
     async def browse(self, path: str) -> Sequence[MediaItemTypeOrItemMapping]:
         """Browse for audiobookshelf.
@@ -666,27 +927,28 @@ class Audiobookshelf(MusicProvider):
             Podcast_1
             Podcast_2
         """
-        item_path = path.split("://", 1)[1]
+        item_path = path.partition("://")[2]
         if not item_path:
             return self._browse_root()
         sub_path = item_path.split("/")
-        lib_key, lib_id = sub_path[0].split(" ")
+        lib_key, _, lib_id = sub_path[0].partition(" ")
         if len(sub_path) == 1:
             if lib_key == AbsBrowsePaths.LIBRARIES_PODCAST:
                 return await self._browse_lib_podcasts(library_id=lib_id)
             else:
-                return self._browse_lib_audiobooks(current_path=path)
+                return self._browse_lib_audiobooks(current_path=path, library_id=lib_id)
         elif len(sub_path) == 2:
             item_key = sub_path[1]
             match item_key:
-                case AbsBrowsePaths.AUTHORS:
-                    return await self._browse_authors(current_path=path, library_id=lib_id)
-                case AbsBrowsePaths.NARRATORS:
-                    return await self._browse_narrators(current_path=path, library_id=lib_id)
-                case AbsBrowsePaths.SERIES:
-                    return await self._browse_series(current_path=path, library_id=lib_id)
-                case AbsBrowsePaths.COLLECTIONS:
-                    return await self._browse_collections(current_path=path, library_id=lib_id)
+                case (
+                    AbsBrowsePaths.AUTHORS
+                    | AbsBrowsePaths.NARRATORS
+                    | AbsBrowsePaths.SERIES
+                    | AbsBrowsePaths.COLLECTIONS
+                ):
+                    return await self._browse_lib_listing(
+                        current_path=path, library_id=lib_id, path_key=item_key
+                    )
                 case AbsBrowsePaths.AUDIOBOOKS:
                     return await self._browse_books(library_id=lib_id)
         elif len(sub_path) == 3:
@@ -709,238 +971,326 @@ class Audiobookshelf(MusicProvider):
         return []
 
     def _browse_root(self) -> Sequence[MediaItemTypeOrItemMapping]:
-        items = []
-
-        def _get_folder(path: str, lib_id: str, lib_name: str) -> BrowseFolder:
-            return BrowseFolder(
+        if self._root_folders is not None:
+            return list(self._root_folders)
+        provider = self.lookup_key
+        instance_id = self.instance_id
+        items: list[BrowseFolder] = [
+            BrowseFolder(
                 item_id=lib_id,
-                name=lib_name,
-                provider=self.lookup_key,
-                path=f"{self.instance_id}://{path}",
+                name=f"{lib.name} ({AbsBrowseItemsBook.AUDIOBOOKS})",
+                provider=provider,
+                path=f"{instance_id}://{AbsBrowsePaths.LIBRARIES_BOOK} {lib_id}",
             )
-
-        for lib_id, lib in self.libraries.audiobooks.items():
-            path = f"{AbsBrowsePaths.LIBRARIES_BOOK} {lib_id}"
-            name = f"{lib.name} ({AbsBrowseItemsBook.AUDIOBOOKS})"
-            items.append(_get_folder(path, lib_id, name))
-        for lib_id, lib in self.libraries.podcasts.items():
-            path = f"{AbsBrowsePaths.LIBRARIES_PODCAST} {lib_id}"
-            name = f"{lib.name} ({AbsBrowseItemsPodcast.PODCASTS})"
-            items.append(_get_folder(path, lib_id, name))
-        return items
+            for lib_id, lib in self.libraries.audiobooks.items()
+        ]
+        items += [
+            BrowseFolder(
+                item_id=lib_id,
+                name=f"{lib.name} ({AbsBrowseItemsPodcast.PODCASTS})",
+                provider=provider,
+                path=f"{instance_id}://{AbsBrowsePaths.LIBRARIES_PODCAST} {lib_id}",
+            )
+            for lib_id, lib in self.libraries.podcasts.items()
+        ]
+        self._root_folders = items
+        return list(items)
 
     async def _browse_lib_podcasts(self, library_id: str) -> list[MediaItemTypeOrItemMapping]:
         """No sub categories for podcasts."""
-        items = []
-        for podcast_id in self.libraries.podcasts[library_id].item_ids:
-            mass_item = await self.mass.music.get_library_item_by_prov_id(
-                media_type=MediaType.PODCAST,
-                item_id=podcast_id,
-                provider_instance_id_or_domain=self.instance_id,
-            )
-            if mass_item is not None:
-                items.append(mass_item)
+        items = await self._get_library_items_by_prov_ids(
+            MediaType.PODCAST, self.libraries.podcasts[library_id].item_ids
+        )
         return sorted(items, key=lambda x: x.name)
 
-    def _browse_lib_audiobooks(self, current_path: str) -> Sequence[MediaItemTypeOrItemMapping]:
-        items = []
-        for item_name in AbsBrowseItemsBook:
-            path = current_path + "/" + ABSBROWSEITEMSTOPATH[item_name]
-            items.append(
-                BrowseFolder(
-                    item_id=item_name.lower(),
-                    name=item_name,
-                    provider=self.lookup_key,
-                    path=path,
+    def _browse_lib_audiobooks(
+        self, current_path: str, library_id: str
+    ) -> Sequence[MediaItemTypeOrItemMapping]:
+        # the user is likely to open one of the sub folders next, so fetch the (cheap)
+        # listings which are not cached yet concurrently in the background already
+        for path_key in LIB_PREFETCH_PATHS:
+            if self._browse_cache.get((library_id, path_key)) is None:
+                task = self._get_lib_listing_task(
+                    f"{current_path}/{path_key}", library_id, path_key
+                )
+                task.add_done_callback(
+                    partial(self._on_lib_listing_prefetched, library_id, path_key)
                 )
+        return list(get_lib_audiobooks_folders(self.lookup_key, current_path))
+
+    def _on_lib_listing_prefetched(
+        self,
+        library_id: str,
+        path_key: str,
+        task: asyncio.Task[Sequence[MediaItemTypeOrItemMapping]],
+    ) -> None:
+        if not task.cancelled() and (err := task.exception()):
+            self.logger.warning(
+                "Prefetching %s of library %s failed: %s",
+                AbsBrowsePaths(path_key).name.lower(),
+                library_id,
+                err,
             )
+
+    async def _browse_lib_listing(
+        self, current_path: str, library_id: str, path_key: str
+    ) -> Sequence[MediaItemTypeOrItemMapping]:
+        """Return the authors, narrators, series or collections of a library."""
+        if (items := self._browse_cache.get((library_id, path_key))) is not None:
+            return list(items)
+        # a listing may already be fetched (e.g. prefetched when the library was opened)
+        task = self._get_lib_listing_task(current_path, library_id, path_key)
+        return list(await asyncio.shield(task))
+
+    def _get_lib_listing_task(
+        self, current_path: str, library_id: str, path_key: str
+    ) -> asyncio.Task[Sequence[MediaItemTypeOrItemMapping]]:
+        """Return the in-flight fetch of a library listing, start it if there is none."""
+        key = (library_id, path_key)
+        if (task := self._browse_requests.get(key)) is None:
+            task = self.mass.create_task(
+                self._fetch_lib_listing(current_path, library_id, path_key)
+            )
+            self._browse_requests[key] = task
+            task.add_done_callback(lambda _: self._browse_requests.pop(key, None))
+        return task
+
+    async def _fetch_lib_listing(
+        self, current_path: str, library_id: str, path_key: str
+    ) -> Sequence[MediaItemTypeOrItemMapping]:
+        match path_key:
+            case AbsBrowsePaths.AUTHORS:
+                items = await self._browse_authors(current_path, library_id)
+            case AbsBrowsePaths.NARRATORS:
+                items = await self._browse_narrators(current_path, library_id)
+            case AbsBrowsePaths.SERIES:
+                items = await self._browse_series(current_path, library_id)
+            case _:
+                items = await self._browse_collections(current_path, library_id)
+        self._browse_cache.set((library_id, path_key), items)
         return items
 
     async def _browse_authors(
         self, current_path: str, library_id: str
     ) -> Sequence[MediaItemTypeOrItemMapping]:
         abs_authors = await self._client.get_library_authors(library_id=library_id)
-        items = []
-        for author in abs_authors:
-            path = f"{current_path}/{author.id_}"
-            items.append(
-                BrowseFolder(
-                    item_id=author.id_,
-                    name=author.name,
-                    provider=self.lookup_key,
-                    path=path,
-                )
+        provider = self.lookup_key
+        prefix = f"{current_path}/"
+        items = [
+            BrowseFolder(
+                item_id=author.id_,
+                name=author.name,
+                provider=provider,
+                path=prefix + author.id_,
             )
-
+            for author in abs_authors
+        ]
         return sorted(items, key=lambda x: x.name)
 
     async def _browse_narrators(
         self, current_path: str, library_id: str
     ) -> Sequence[MediaItemTypeOrItemMapping]:
         abs_narrators = await self._client.get_library_narrators(library_id=library_id)
-        items = []
-        for narrator in abs_narrators:
-            path = f"{current_path}/{narrator.id_}"
-            items.append(
-                BrowseFolder(
-                    item_id=narrator.id_,
-                    name=narrator.name,
-                    provider=self.lookup_key,
-                    path=path,
-                )
+        provider = self.lookup_key
+        prefix = f"{current_path}/"
+        items = [
+            BrowseFolder(
+                item_id=narrator.id_,
+                name=narrator.name,
+                provider=provider,
+                path=prefix + narrator.id_,
             )
-
+            for narrator in abs_narrators
+        ]
         return sorted(items, key=lambda x: x.name)
 
     async def _browse_series(
         self, current_path: str, library_id: str
     ) -> Sequence[MediaItemTypeOrItemMapping]:
-        items = []
-        async for response in self._client.get_library_series(library_id=library_id):
+        provider = self.lookup_key
+        prefix = f"{current_path}/"
+        items: list[MediaItemTypeOrItemMapping] = []
+        # fetch the next page while the current one is processed
+        async for response in merge_async_iterators(
+            self._client.get_library_series(library_id=library_id)
+        ):
             if not response.results:
                 break
-            for abs_series in response.results:
-                path = f"{current_path}/{abs_series.id_}"
-                items.append(
-                    BrowseFolder(
-                        item_id=abs_series.id_,
-                        name=abs_series.name,
-                        provider=self.lookup_key,
-                        path=path,
-                    )
+            items += [
+                BrowseFolder(
+                    item_id=abs_series.id_,
+                    name=abs_series.name,
+                    provider=provider,
+                    path=prefix + abs_series.id_,
                 )
+                for abs_series in response.results
+            ]
 
         return sorted(items, key=lambda x: x.name)
 
     async def _browse_collections(
         self, current_path: str, library_id: str
     ) -> Sequence[MediaItemTypeOrItemMapping]:
-        items = []
-        async for response in self._client.get_library_collections(library_id=library_id):
+        provider = self.lookup_key
+        prefix = f"{current_path}/"
+        items: list[MediaItemTypeOrItemMapping] = []
+        # fetch the next page while the current one is processed
+        async for response in merge_async_iterators(
+            self._client.get_library_collections(library_id=library_id)
+        ):
             if not response.results:
                 break
-            for abs_collection in response.results:
-                path = f"{current_path}/{abs_collection.id_}"
-                items.append(
-                    BrowseFolder(
-                        item_id=abs_collection.id_,
-                        name=abs_collection.name,
-                        provider=self.lookup_key,
-                        path=path,
-                    )
+            items += [
+                BrowseFolder(
+                    item_id=abs_collection.id_,
+                    name=abs_collection.name,
+                    provider=provider,
+                    path=prefix + abs_collection.id_,
                 )
+                for abs_collection in response.results
+            ]
         return sorted(items, key=lambda x: x.name)
 
     async def _browse_books(self, library_id: str) -> Sequence[MediaItemTypeOrItemMapping]:
-        items = []
-        for book_id in self.libraries.audiobooks[library_id].item_ids:
-            mass_item = await self.mass.music.get_library_item_by_prov_id(
-                media_type=MediaType.AUDIOBOOK,
-                item_id=book_id,
-                provider_instance_id_or_domain=self.instance_id,
-            )
-            if mass_item is not None:
-                items.append(mass_item)
+        items = await self._get_library_items_by_prov_ids(
+            MediaType.AUDIOBOOK, self.libraries.audiobooks[library_id].item_ids
+        )
         return sorted(items, key=lambda x: x.name)
 
     async def _browse_author_books(
         self, current_path: str, author_id: str
     ) -> Sequence[MediaItemTypeOrItemMapping]:
-        items: list[MediaItemTypeOrItemMapping] = []
+        author_series, book_ids = await self._get_author_series_and_book_ids(author_id=author_id)
+        provider = self.lookup_key
+        prefix = f"{current_path}/"
+        items: list[MediaItemTypeOrItemMapping] = [
+            BrowseFolder(
+                item_id=series_id,
+                name=f"{series_name} ({AbsBrowseItemsBook.SERIES})",
+                provider=provider,
+                path=prefix + series_id,
+            )
+            for series_id, series_name in author_series
+        ]
+        items += await self._get_library_items_by_prov_ids(MediaType.AUDIOBOOK, book_ids)
+
+        return items
 
+    async def _get_author_series_and_book_ids(
+        self, author_id: str
+    ) -> tuple[list[tuple[str, str]], list[str]]:
+        """Return (id, name) of the series of an author and the ids of the books outside them."""
+        cache_key = (AbsBrowsePaths.AUTHORS, author_id)
+        if (cached := self._book_ids_cache.get(cache_key)) is not None:
+            return cached
         abs_author = await self._client.get_author(
             author_id=author_id, include_items=True, include_series=True
         )
-        if not isinstance(abs_author, AbsAuthorWithItemsAndSeries):
-            raise TypeError("Unexpected type of author.")
-
-        book_ids = {x.id_ for x in abs_author.library_items}
-        series_book_ids = set()
-
-        for series in abs_author.series:
-            series_book_ids.update([x.id_ for x in series.items])
-            path = f"{current_path}/{series.id_}"
-            items.append(
-                BrowseFolder(
-                    item_id=series.id_,
-                    name=f"{series.name} ({AbsBrowseItemsBook.SERIES})",
-                    provider=self.lookup_key,
-                    path=path,
-                )
-            )
-        book_ids = book_ids.difference(series_book_ids)
-        for book_id in book_ids:
-            mass_item = await self.mass.music.get_library_item_by_prov_id(
-                media_type=MediaType.AUDIOBOOK,
-                item_id=book_id,
-                provider_instance_id_or_domain=self.instance_id,
-            )
-            if mass_item is not None:
-                items.append(mass_item)
-
-        return items
+        assert isinstance(abs_author, AbsAuthorWithItemsAndSeries)
+        series_book_ids = {x.id_ for series in abs_author.series for x in series.items}
+        # books not part of a series, in the order of abs
+        result = (
+            [(series.id_, series.name) for series in abs_author.series],
+            [x.id_ for x in abs_author.library_items if x.id_ not in series_book_ids],
+        )
+        self._book_ids_cache.set(cache_key, result)
+        return result
 
     async def _browse_narrator_books(
         self, library_id: str, narrator_filter_str: str
     ) -> Sequence[MediaItemTypeOrItemMapping]:
         items: list[MediaItemTypeOrItemMapping] = []
-        async for response in self._client.get_library_items(
-            library_id=library_id, filter_str=f"narrators.{narrator_filter_str}"
+        # fetch the next page while the current one is processed
+        async for response in merge_async_iterators(
+            self._client.get_library_items(
+                library_id=library_id, filter_str=f"narrators.{narrator_filter_str}"
+            )
         ):
             if not response.results:
                 break
-            for item in response.results:
-                mass_item = await self.mass.music.get_library_item_by_prov_id(
-                    media_type=MediaType.AUDIOBOOK,
-                    item_id=item.id_,
-                    provider_instance_id_or_domain=self.instance_id,
-                )
-                if mass_item is not None:
-                    items.append(mass_item)
+            items += await self._get_library_items_by_prov_ids(
+                MediaType.AUDIOBOOK, [item.id_ for item in response.results]
+            )
 
         return sorted(items, key=lambda x: x.name)
 
     async def _browse_series_books(self, series_id: str) -> Sequence[MediaItemTypeOrItemMapping]:
-        items = []
-
+        book_ids = await self._get_series_book_ids(series_id=series_id)
+        return await self._get_library_items_by_prov_ids(MediaType.AUDIOBOOK, book_ids)
+
+    async def _get_series_book_ids(self, series_id: str) -> list[str]:
+        """Return the ids of the books of a series."""
+        cache_key = (AbsBrowsePaths.SERIES, series_id)
+        if (cached := self._book_ids_cache.get(cache_key)) is not None:
+            return cached[1]
         abs_series = await self._client.get_series(series_id=series_id, include_progress=True)
-        if not isinstance(abs_series, AbsSeriesWithProgress):
-            raise TypeError("Unexpected series type.")
-
-        for book_id in abs_series.progress.library_item_ids:
-            # these are sorted in abs by sequence
-            mass_item = await self.mass.music.get_library_item_by_prov_id(
-                media_type=MediaType.AUDIOBOOK,
-                item_id=book_id,
-                provider_instance_id_or_domain=self.instance_id,
-            )
-            if mass_item is not None:
-                items.append(mass_item)
-
-        return items
+        assert isinstance(abs_series, AbsSeriesWithProgress)
+        # these are sorted in abs by sequence
+        book_ids = list(abs_series.progress.library_item_ids)
+        self._book_ids_cache.set(cache_key, ([], book_ids))
+        return book_ids
 
     async def _browse_collection_books(
         self, collection_id: str
     ) -> Sequence[MediaItemTypeOrItemMapping]:
-        items = []
+        book_ids = await self._get_collection_book_ids(collection_id=collection_id)
+        return await self._get_library_items_by_prov_ids(MediaType.AUDIOBOOK, book_ids)
+
+    async def _get_collection_book_ids(self, collection_id: str) -> list[str]:
+        """Return the ids of the books of a collection."""
+        cache_key = (AbsBrowsePaths.COLLECTIONS, collection_id)
+        if (cached := self._book_ids_cache.get(cache_key)) is not None:
+            return cached[1]
         abs_collection = await self._client.get_collection(collection_id=collection_id)
-        for book in abs_collection.books:
-            mass_item = await self.mass.music.get_library_item_by_prov_id(
-                media_type=MediaType.AUDIOBOOK,
-                item_id=book.id_,
-                provider_instance_id_or_domain=self.instance_id,
-            )
-            if mass_item is not None:
-                items.append(mass_item)
-        return items
+        book_ids = [book.id_ for book in abs_collection.books]
+        self._book_ids_cache.set(cache_key, ([], book_ids))
+        return book_ids
+
+    async def _get_library_items_by_prov_ids(
+        self, media_type: MediaType, item_ids: Iterable[str]
+    ) -> list[MediaItemTypeOrItemMapping]:
+        """Return the library items of the given provider item ids, keeping their order.
+
+        Ids without a library item are skipped.
+        """
+        # the same books show up browsing authors, series and collections,
+        # so recently looked up items are kept for a short time
+        item_ids = list(item_ids)
+        found: dict[str, MediaItemType] = {}
+        for item_id in item_ids:
+            if (library_item := self._library_item_cache.get((media_type, item_id))) is not None:
+                found[item_id] = library_item
+        if missing := tuple(dict.fromkeys(x for x in item_ids if x not in found)):
+            # a single (batched) database lookup instead of one per item,
+            # which is shared by concurrent requests for the same items
+            key = (media_type, missing)
+            if (task := self._lookup_requests.get(key)) is None:
+                task = self.mass.create_task(
+                    self.mass.music.get_library_items_by_prov_ids(
+                        media_type=media_type,
+                        item_ids=list(missing),
+                        provider_instance_id_or_domain=self.instance_id,
+                    )
+                )
+                self._lookup_requests[key] = task
+                task.add_done_callback(lambda _: self._lookup_requests.pop(key, None))
+            for library_item in await asyncio.shield(task):
+                for mapping in library_item.provider_mappings:
+                    if mapping.provider_instance == self.instance_id:
+                        found[mapping.item_id] = library_item
+                        self._library_item_cache.set((media_type, mapping.item_id), library_item)
+        return [found[item_id] for item_id in item_ids if item_id in found]
 
     async def _socket_abs_item_changed(
         self, items: LibraryItemExpanded | list[LibraryItemExpanded]
     ) -> None:
         """For added and updated."""
         abs_items = [items] if isinstance(items, LibraryItemExpanded) else items
+        token = self._client.token
         for abs_item in abs_items:
             if isinstance(abs_item, LibraryItemExpandedBook):
+                self._audiobook_cache.pop(abs_item.id_)
+                self._library_item_cache.pop((MediaType.AUDIOBOOK, abs_item.id_))
                 self.logger.debug(
                     'Updated book "%s" via socket.', abs_item.media.metadata.title or ""
                 )
@@ -950,8 +1300,8 @@ class Audiobookshelf(MusicProvider):
                         lookup_key=self.lookup_key,
                         domain=self.domain,
                         instance_id=self.instance_id,
-                        token=self._client.token,
-                        base_url=str(self.config.get_value(CONF_URL)).rstrip("/"),
+                        token=token,
+                        base_url=self._base_url,
                     ),
                     overwrite_existing=True,
                 )
@@ -959,6 +1309,8 @@ class Audiobookshelf(MusicProvider):
                 if lib is not None:
                     lib.item_ids.add(abs_item.id_)
             elif isinstance(abs_item, LibraryItemExpandedPodcast):
+                self._podcast_cache.pop(abs_item.id_)
+                self._library_item_cache.pop((MediaType.PODCAST, abs_item.id_))
                 self.logger.debug(
                     'Updated podcast "%s" via socket.', abs_item.media.metadata.title or ""
                 )
@@ -967,13 +1319,10 @@ class Audiobookshelf(MusicProvider):
                     lookup_key=self.lookup_key,
                     domain=self.domain,
                     instance_id=self.instance_id,
-                    token=self._client.token,
-                    base_url=str(self.config.get_value(CONF_URL)).rstrip("/"),
+                    token=token,
+                    base_url=self._base_url,
                 )
-                if not (
-                    bool(self.config.get_value(CONF_HIDE_EMPTY_PODCASTS))
-                    and mass_podcast.total_episodes == 0
-                ):
+                if not (self._hide_empty_podcasts and mass_podcast.total_episodes == 0):
                     await self.mass.music.podcasts.add_item_to_library(
                         mass_podcast,
                         overwrite_existing=True,
@@ -981,7 +1330,7 @@ class Audiobookshelf(MusicProvider):
                     lib = self.libraries.podcasts.get(abs_item.library_id, None)
                     if lib is not None:
                         lib.item_ids.add(abs_item.id_)
-        await self._cache_set_helper_libraries()
+        self._schedule_cache_set_helper_libraries()
 
     async def _socket_abs_item_removed(self, item: LibraryItemRemoved) -> None:
         """Item removed."""
@@ -997,7 +1346,10 @@ class Audiobookshelf(MusicProvider):
                 lib.item_ids.remove(item.id_)
                 break
 
+        self._audiobook_cache.pop(item.id_)
+        self._podcast_cache.pop(item.id_)
         if media_type is not None:
+            self._library_item_cache.pop((media_type, item.id_))
             mass_item = await self.mass.music.get_library_item_by_prov_id(
                 media_type=media_type,
                 item_id=item.id_,
@@ -1009,12 +1361,36 @@ class Audiobookshelf(MusicProvider):
                 )
                 self.logger.debug('Removed %s "%s" via socket.', media_type.value, mass_item.name)
 
-        await self._cache_set_helper_libraries()
+        self._schedule_cache_set_helper_libraries()
+
+    def _schedule_cache_set_helper_libraries(self) -> None:
+        """Debounce storing the libraries, as socket events tend to arrive in bursts."""
+        self._libraries_cache_write = self.mass.call_later(
+            LIBRARIES_CACHE_WRITE_DELAY,
+            self._cache_set_helper_libraries,
+            task_id=f"abs_cache_libraries_{self.instance_id}",
+        )
 
     async def _cache_set_helper_libraries(self) -> None:
+        # this write covers a pending (debounced) one as well
+        if self._libraries_cache_write is not None:
+            self._libraries_cache_write.cancel()
+            self._libraries_cache_write = None
+        # copying the id sets is cheap, the (recursive) conversion of
+        # large libraries is not, so only the latter runs in a thread
+        libraries = LibrariesHelper(
+            audiobooks={
+                lib_id: LibraryHelper(name=lib.name, item_ids=lib.item_ids.copy())
+                for lib_id, lib in self.libraries.audiobooks.items()
+            },
+            podcasts={
+                lib_id: LibraryHelper(name=lib.name, item_ids=lib.item_ids.copy())
+                for lib_id, lib in self.libraries.podcasts.items()
+            },
+        )
         await self.mass.cache.set(
             key=CACHE_KEY_LIBRARIES,
             base_key=self.cache_base_key,
             category=CACHE_CATEGORY_LIBRARIES,
-            data=self.libraries.to_dict(),
+            data=await asyncio.to_thread(libraries.to_dict),
         )
@@ -9,7 +9,9 @@ import os
 import os.path
 import time
 import urllib.parse
+from collections import deque
 from collections.abc import AsyncGenerator, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
@@ -63,7 +65,12 @@ from music_assistant.helpers.ffmpeg import get_ffmpeg_stream
 from music_assistant.helpers.json import json_loads
 from music_assistant.helpers.playlists import parse_m3u, parse_pls
 from music_assistant.helpers.tags import AudioTags, async_parse_tags, parse_tags, split_items
-from music_assistant.helpers.util import TaskManager, parse_title_and_version, try_parse_int
+from music_assistant.helpers.util import (
+    TaskManager,
+    TimedMemoryCache,
+    parse_title_and_version,
+    try_parse_int,
+)
 from music_assistant.models.music_provider import MusicProvider
 
 from .constants import (
@@ -72,7 +79,10 @@ from .constants import (
     CONF_ENTRY_CONTENT_TYPE_READ_ONLY,
     CONF_ENTRY_MISSING_ALBUM_ARTIST,
     CONF_ENTRY_PATH,
+    DIR_CACHE_TTL,
     IMAGE_EXTENSIONS,
+    LISTDIR_MAX_PENDING,
+    LISTDIR_WORKERS,
     PLAYLIST_EXTENSIONS,
     PODCAST_EPISODE_EXTENSIONS,
     SUPPORTED_EXTENSIONS,
@@ -157,6 +167,15 @@ class LocalFileSystemProvider(MusicProvider):
         self.write_access: bool = False
         self.sync_running: bool = False
         self.media_content_type = cast(str, config.get_value(CONF_ENTRY_CONTENT_TYPE.key))
+        # (absolute path, sorted): directory listing
+        self._dir_cache: TimedMemoryCache[tuple[str, bool], tuple[FileSystemItem, ...]] = (
+            TimedMemoryCache(DIR_CACHE_TTL)
+        )
+        # the directory listings of the library sync share a small (dedicated) pool of threads,
+        # to not overload the (remote) filesystem and the default executor
+        self._listdir_executor = ThreadPoolExecutor(
+            max_workers=LISTDIR_WORKERS, thread_name_prefix=f"listdir_{self.instance_id}"
+        )
 
     @property
     def supported_features(self) -> set[ProviderFeature]:
@@ -199,6 +218,14 @@ class LocalFileSystemProvider(MusicProvider):
             raise SetupFailedError(msg)
         await self.check_write_access()
 
+    async def unload(self, is_removed: bool = False) -> None:
+        """
+        Handle unload/close of the provider.
+
+        Called when provider is deregistered (e.g. MA exiting or config reloading).
+        """
+        self._listdir_executor.shutdown(wait=False, cancel_futures=True)
+
     async def search(
         self,
         search_query: str,
@@ -262,7 +289,7 @@ class LocalFileSystemProvider(MusicProvider):
         if not item_path:
             item_path = ""
         abs_path = self.get_absolute_path(item_path)
-        for item in await asyncio.to_thread(sorted_scandir, self.base_path, abs_path, sort=True):
+        for item in await self._scandir(abs_path, sort=True):
             if not item.is_dir and ("." not in item.filename or not item.ext):
                 # skip system files and files without extension
                 continue
@@ -325,15 +352,19 @@ class LocalFileSystemProvider(MusicProvider):
         prev_filenames = set(file_checksums.keys())
 
         # NOTE: we do the entire traversing of the directory structure, including parsing tags
-        # in a single executor thread to save the overhead of having to spin up tons of tasks
-        def listdir(path: str) -> Iterator[FileSystemItem]:
-            """Recursively traverse directory entries."""
+        # in a single executor thread to save the overhead of having to spin up tons of tasks.
+        # Only the directory listings are done by a small pool of worker threads, so sibling
+        # directories are scanned concurrently while the files are being processed.
+        def scan_dir(path: str) -> tuple[list[FileSystemItem], list[str]]:
+            """Return the supported files and the subdirectories of a single directory."""
+            files: list[FileSystemItem] = []
+            subdirs: list[str] = []
             for item in os.scandir(path):
                 # ignore invalid filenames
                 if item.name in IGNORE_DIRS or item.name.startswith((".", "_")):
                     continue
                 if item.is_dir(follow_symlinks=False):
-                    yield from listdir(item.path)
+                    subdirs.append(item.path)
                 elif item.is_file(follow_symlinks=False):
                     # skip files without extension
                     if "." not in item.name:
@@ -342,7 +373,28 @@ class LocalFileSystemProvider(MusicProvider):
                     if ext not in SUPPORTED_EXTENSIONS:
                         # skip unsupported file extension
                         continue
-                    yield FileSystemItem.from_dir_entry(item, self.base_path)
+                    files.append(FileSystemItem.from_dir_entry(item, self.base_path))
+            return files, subdirs
+
+        def listdir(path: str) -> Iterator[FileSystemItem]:
+            """Recursively traverse directory entries."""
+            executor = self._listdir_executor
+            pending = deque([executor.submit(scan_dir, path)])
+            # directories that are not yet submitted, so the scan stays only
+            # a few directories ahead of the processing of the files
+            queued: deque[str] = deque()
+            try:
+                while pending:
+                    files, subdirs = pending.popleft().result()
+                    queued.extend(subdirs)
+                    # schedule the next directories before handing out the files
+                    # so the workers can continue while the files are processed
+                    while queued and len(pending) < LISTDIR_MAX_PENDING:
+                        pending.append(executor.submit(scan_dir, queued.popleft()))
+                    yield from files
+            finally:
+                for future in pending:
+                    future.cancel()
 
         def run_sync() -> None:
             """Run the actual sync (in an executor job)."""
@@ -714,7 +766,7 @@ class LocalFileSystemProvider(MusicProvider):
                 episodes.append(episode)
 
         async with TaskManager(self.mass, 25) as tm:
-            for item in await asyncio.to_thread(sorted_scandir, self.base_path, prov_podcast_id):
+            for item in await self._scandir(prov_podcast_id):
                 if "." not in item.relative_path or item.is_dir:
                     continue
                 if item.ext not in PODCAST_EPISODE_EXTENSIONS:
@@ -1137,7 +1189,7 @@ class LocalFileSystemProvider(MusicProvider):
         if not audio_book.image or not audio_book.metadata.description:
             # try to get an image by traversing files in the same folder
             abs_path = self.get_absolute_path(file_item.parent_path)
-            for _item in await asyncio.to_thread(sorted_scandir, self.base_path, abs_path):
+            for _item in await self._scandir(abs_path):
                 if "." not in _item.relative_path or _item.is_dir:
                     continue
                 if _item.ext in IMAGE_EXTENSIONS and not audio_book.image:
@@ -1455,7 +1507,7 @@ class LocalFileSystemProvider(MusicProvider):
             extra_thumb_names = ()
         images: UniqueList[MediaItemImage] = UniqueList()
         abs_path = self.get_absolute_path(folder)
-        folder_files = await asyncio.to_thread(sorted_scandir, self.base_path, abs_path, sort=False)
+        folder_files = await self._scandir(abs_path)
         for item in folder_files:
             if "." not in item.relative_path or item.is_dir or not item.ext:
                 continue
@@ -1534,6 +1586,22 @@ class LocalFileSystemProvider(MusicProvider):
         # run in thread because strictly taken this may be blocking IO
         return await asyncio.to_thread(_create_item)
 
+    async def _scandir(self, sub_path: str, sort: bool = False) -> list[FileSystemItem]:
+        """
+        Return the (optionally sorted) entries of a directory.
+
+        Listings are kept in a short-lived memory cache to prevent repeated listings
+        of the same directory, which can be expensive on network shares.
+        """
+        abs_path = self.get_absolute_path(sub_path)
+        cache_key = (abs_path, sort)
+        if (items := self._dir_cache.get(cache_key)) is None:
+            # run in thread because strictly taken this may be blocking IO
+            # (not on the listdir executor, to not queue up behind a running library sync)
+            items = tuple(await asyncio.to_thread(sorted_scandir, self.base_path, abs_path, sort))
+            self._dir_cache.set(cache_key, items)
+        return list(items)
+
     async def exists(self, file_path: str) -> bool:
         """Return bool is this FileSystem musicprovider has given file/dir."""
         if not file_path:
@@ -1678,7 +1746,7 @@ class LocalFileSystemProvider(MusicProvider):
         chapter_file_tags: list[AudioTags] = []
         total_duration = 0.0
         abs_path = self.get_absolute_path(audiobook_file_item.parent_path)
-        for item in await asyncio.to_thread(sorted_scandir, self.base_path, abs_path, sort=True):
+        for item in await self._scandir(abs_path, sort=True):
             if "." not in item.relative_path or item.is_dir:
                 continue
             if item.ext not in AUDIOBOOK_EXTENSIONS:
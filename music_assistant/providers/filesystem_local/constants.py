@@ -99,6 +99,14 @@ SUPPORTED_EXTENSIONS = {
     *PLAYLIST_EXTENSIONS,
 }
 
+# max number of directories to scan concurrently during library sync
+# (mostly beneficial for network shares where each listing is a round trip)
+LISTDIR_WORKERS = 4
+# max number of directory listings to have in flight during library sync,
+# the remaining directories are queued (as plain paths) until there is room
+LISTDIR_MAX_PENDING = LISTDIR_WORKERS * 2
+# time (in seconds) to keep directory listings in the (memory) cache
+DIR_CACHE_TTL = 30
 
 SUPPORTED_FEATURES = {
     ProviderFeature.LIBRARY_ARTISTS,
@@ -11,7 +11,7 @@ from music_assistant.helpers.compare import compare_strings
 IGNORE_DIRS = ("recycle", "Recently-Snaphot")
 
 
-@dataclass
+@dataclass(slots=True)
 class FileSystemItem:
     """Representation of an item (file or directory) on the filesystem.
 
@@ -192,10 +192,11 @@ def get_album_dir(track_dir: str, album_name: str) -> str | None:
 def get_relative_path(base_path: str, path: str) -> str:
     """Return the relative path string for a path."""
     if path.startswith(base_path):
-        path = path.split(base_path)[1]
-    for sep in ("/", "\\"):
-        if path.startswith(sep):
-            path = path[1:]
+        path = path[len(base_path) :]
+    if path.startswith("/"):
+        path = path[1:]
+    if path.startswith("\\"):
+        path = path[1:]
     return path
 
 
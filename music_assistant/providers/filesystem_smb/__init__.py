@@ -176,6 +176,7 @@ class SMBFileSystemProvider(LocalFileSystemProvider):
 
         Called when provider is deregistered (e.g. MA exiting or config reloading).
         """
+        await super().unload(is_removed)
         await self.unmount()
 
     async def mount(self) -> None:
@@ -1,5 +1,8 @@
 """Tests for utility/helper functions."""
 
+import asyncio
+from collections.abc import AsyncGenerator
+
 import pytest
 from music_assistant_models.enums import MediaType
 from music_assistant_models.errors import MusicAssistantError
@@ -80,3 +83,53 @@ async def test_uri_parsing() -> None:
     # test invalid uri
     with pytest.raises(MusicAssistantError):
         await uri.parse_uri("invalid://blah")
+
+
+async def test_merge_async_iterators() -> None:
+    """Test merging (and prefetching) of async iterators."""
+
+    async def _gen(prefix: str, count: int) -> AsyncGenerator[str, None]:
+        for idx in range(count):
+            await asyncio.sleep(0)
+            yield f"{prefix}{idx}"
+
+    result = [x async for x in util.merge_async_iterators(_gen("a", 3), _gen("b", 2))]
+    assert sorted(result) == ["a0", "a1", "a2", "b0", "b1"]
+    # order within a single iterator is preserved
+    assert [x for x in result if x.startswith("a")] == ["a0", "a1", "a2"]
+    assert [x async for x in util.merge_async_iterators()] == []
+
+    async def _failing_gen() -> AsyncGenerator[str, None]:
+        yield "x0"
+        raise MusicAssistantError("failed")
+
+    with pytest.raises(MusicAssistantError):
+        async for _ in util.merge_async_iterators(_failing_gen(), buffer_size=5):
+            pass
+
+
+def test_timed_memory_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the (in-memory) cache with expiring items."""
+    now = 1000.0
+    monkeypatch.setattr(util.time, "monotonic", lambda: now)
+    cache: util.TimedMemoryCache[str, int] = util.TimedMemoryCache(ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    assert cache.get("c") is None
+    assert cache.get("c", 3) == 3
+    cache.pop("b")
+    cache.pop("b")
+    assert cache.get("b") is None
+    now += 9
+    assert cache.get("a") == 1
+    now += 1
+    assert cache.get("a") is None
+    # expired items are dropped when storing a new one
+    cache.set("b", 2)
+    cache.set("c", 3)
+    now += 10
+    cache.set("d", 4)
+    assert len(cache) == 1
+    cache.clear()
+    assert cache.get("d") is None
@@ -0,0 +1,44 @@
+"""Tests for the (base) media controller."""
+
+from music_assistant_models import media_items
+
+from music_assistant.mass import MusicAssistant
+
+
+def _create_artist(item_id: str, provider_instance: str) -> media_items.Artist:
+    """Create a (provider) artist."""
+    return media_items.Artist(
+        item_id=item_id,
+        provider=provider_instance,
+        name=f"Artist {item_id}",
+        provider_mappings={
+            media_items.ProviderMapping(
+                item_id=item_id, provider_domain="test", provider_instance=provider_instance
+            )
+        },
+    )
+
+
+async def test_get_library_items_by_prov_ids(mass: MusicAssistant) -> None:
+    """Test the (batched) lookup of library items by provider item ids."""
+    controller = mass.music.artists
+    # more items than fit in a single query chunk
+    prov_ids = [f"a{idx}" for idx in range(510)]
+    for prov_id in prov_ids:
+        await controller.add_item_to_library(_create_artist(prov_id, "test1"))
+    await controller.add_item_to_library(_create_artist("b0", "test2"))
+
+    # the order of the given ids is kept and missing ids are skipped
+    query_ids = ["missing1", *reversed(prov_ids), "missing2", "b0"]
+    result = await controller.get_library_items_by_prov_ids(query_ids, "test1")
+    assert [item.name for item in result] == [f"Artist {x}" for x in reversed(prov_ids)]
+    assert all(item.provider == "library" for item in result)
+
+    # lookup by provider domain matches the items of all its instances
+    result = await controller.get_library_items_by_prov_ids(["b0", "a1"], "test")
+    assert [item.name for item in result] == ["Artist b0", "Artist a1"]
+    result = await controller.get_library_items_by_prov_ids(["b0", "a1"], "test2")
+    assert [item.name for item in result] == ["Artist b0"]
+
+    assert await controller.get_library_items_by_prov_ids([], "test1") == []
+    assert await mass.music.albums.get_library_items_by_prov_ids(prov_ids[:5], "test1") == []
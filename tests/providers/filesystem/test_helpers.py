@@ -112,3 +112,18 @@ def test_get_artist_dir() -> None:
 def test_get_album_dir(album_name: str, track_dir: str, expected: str) -> None:
     """Test the extraction of an album dir."""
     assert helpers.get_album_dir(track_dir, album_name) == expected
+
+
+@pytest.mark.parametrize(
+    ("base_path", "path", "expected"),
+    [
+        ("/media/music", "/media/music/Artist/Album/track.mp3", "Artist/Album/track.mp3"),
+        ("/media/music", "Artist/Album/track.mp3", "Artist/Album/track.mp3"),
+        ("/media/music", "/media/music", ""),
+        # base path (name) also present deeper in the path
+        ("/music", "/music/Artist/music/track.mp3", "Artist/music/track.mp3"),
+    ],
+)
+def test_get_relative_path(base_path: str, path: str, expected: str) -> None:
+    """Test the conversion of a path to a path relative to the base path."""
+    assert helpers.get_relative_path(base_path, path) == expected